@@ -1,10 +1,24 @@
 from typing import Iterable
+import io
+import mmap
+import os
 
 
 
+def read_source(namefile):
+    # Mapeia o arquivo em memória e decodifica direto do mapeamento, sem
+    # copiar o conteúdo para um bytes intermediário
+    with open(namefile, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return ""  # mmap não aceita arquivos vazios
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
 def read_file(namefile):
-    with open(namefile, "r") as fp:
-        return list(filter(lambda l: l != " ",map(lambda l: l.strip("\n"),fp.readlines())))
+    # Quebra em '\r\n', '\r' e '\n', como a leitura do arquivo em modo texto
+    lines = io.StringIO(read_source(namefile), newline=None)
+    return [line.rstrip("\n") for line in lines if line.strip()]
     
     
     
@@ -7,18 +7,26 @@
 
 namespace aqua::lexing {
 
-static const std::unordered_set<std::string> kKeywords = {
-    "func","let","import","spawn","match","case","loop","break","continue",
-    "if","else","return","make_channel","sleep","true","false","None",
-    // tipos
-    "int","float","string","bool"
+// Tipo de token de cada palavra reservada reconhecida pelo lexer
+static const std::unordered_map<std::string, TokenType> kKeywordTypes = {
+    {"true", TokenType::TRUE}, {"false", TokenType::FALSE}, {"None", TokenType::NONE},
+
+    {"func", TokenType::FUNC}, {"let", TokenType::LET}, {"import", TokenType::IMPORT},
+    {"spawn", TokenType::SPAWN}, {"match", TokenType::MATCH}, {"case", TokenType::CASE},
+    {"loop", TokenType::LOOP}, {"break", TokenType::BREAK}, {"continue", TokenType::CONTINUE},
+    {"if", TokenType::IF}, {"else", TokenType::ELSE}, {"return", TokenType::RETURN},
+    {"make_channel", TokenType::MAKE_CHANNEL}, {"sleep", TokenType::SLEEP},
+
+    {"int", TokenType::INT}, {"float", TokenType::FLOAT}, {"string", TokenType::STRING_TYPE},
+    {"bool", TokenType::BOOL}, {"and", TokenType::AND}, {"or", TokenType::OR},
+    {"not", TokenType::NOT},
 };
 
 Lexer::Lexer(std::string source)
     : input(std::move(source)) {}
 
 bool Lexer::isKeyword(std::string_view word) {
-    return kKeywords.find(std::string(word)) != kKeywords.end();
+    return kKeywordTypes.find(std::string(word)) != kKeywordTypes.end();
 }
 
 char Lexer::peek(size_t lookahead) const {
@@ -145,33 +153,11 @@ std::optional<Token> Lexer::readIdentifierOrKeyword() {
         lexeme.push_back(advance());
     }
 
-    // keywords e booleanos/None
-    if (lexeme == "true") return Token{TokenType::TRUE, lexeme, startLine, startColumn};
-    if (lexeme == "false") return Token{TokenType::FALSE, lexeme, startLine, startColumn};
-    if (lexeme == "None") return Token{TokenType::NONE, lexeme, startLine, startColumn};
-
-    if (lexeme == "func") return Token{TokenType::FUNC, lexeme, startLine, startColumn};
-    if (lexeme == "let") return Token{TokenType::LET, lexeme, startLine, startColumn};
-    if (lexeme == "import") return Token{TokenType::IMPORT, lexeme, startLine, startColumn};
-    if (lexeme == "spawn") return Token{TokenType::SPAWN, lexeme, startLine, startColumn};
-    if (lexeme == "match") return Token{TokenType::MATCH, lexeme, startLine, startColumn};
-    if (lexeme == "case") return Token{TokenType::CASE, lexeme, startLine, startColumn};
-    if (lexeme == "loop") return Token{TokenType::LOOP, lexeme, startLine, startColumn};
-    if (lexeme == "break") return Token{TokenType::BREAK, lexeme, startLine, startColumn};
-    if (lexeme == "continue") return Token{TokenType::CONTINUE, lexeme, startLine, startColumn};
-    if (lexeme == "if") return Token{TokenType::IF, lexeme, startLine, startColumn};
-    if (lexeme == "else") return Token{TokenType::ELSE, lexeme, startLine, startColumn};
-    if (lexeme == "return") return Token{TokenType::RETURN, lexeme, startLine, startColumn};
-    if (lexeme == "make_channel") return Token{TokenType::MAKE_CHANNEL, lexeme, startLine, startColumn};
-    if (lexeme == "sleep") return Token{TokenType::SLEEP, lexeme, startLine, startColumn};
-
-    if (lexeme == "int") return Token{TokenType::INT, lexeme, startLine, startColumn};
-    if (lexeme == "float") return Token{TokenType::FLOAT, lexeme, startLine, startColumn};
-    if (lexeme == "string") return Token{TokenType::STRING_TYPE, lexeme, startLine, startColumn};
-    if (lexeme == "bool") return Token{TokenType::BOOL, lexeme, startLine, startColumn};
-    if (lexeme == "and") return Token{TokenType::AND, lexeme, startLine, startColumn};
-    if (lexeme == "or") return Token{TokenType::OR, lexeme, startLine, startColumn};
-    if (lexeme == "not") return Token{TokenType::NOT, lexeme, startLine, startColumn};
+    // keywords, booleanos/None e tipos: uma única busca na tabela
+    auto keyword = kKeywordTypes.find(lexeme);
+    if (keyword != kKeywordTypes.end()) {
+        return Token{keyword->second, lexeme, startLine, startColumn};
+    }
 
     return Token{TokenType::IDENTIFIER, lexeme, startLine, startColumn};
 }
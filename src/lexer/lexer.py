@@ -4,9 +4,12 @@ Lexer para a linguagem de programação Aqua
 Analisa o código fonte e gera tokens para o parser
 """
 
+from bisect import bisect_right
 from enum import Enum, auto
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Tuple
 import re
+import string
+import sys
 
 class TokenType(Enum):
     # Palavras-chave
@@ -57,6 +60,8 @@ class TokenType(Enum):
     EOF = auto()
 
 class Token:
+    __slots__ = ('type', 'value', 'line', 'column')
+    
     def __init__(self, type: TokenType, value: str, line: int, column: int):
         self.type = type
         self.value = value
@@ -66,169 +71,290 @@ class Token:
     def __repr__(self):
         return f"Token({self.type}, '{self.value}', line={self.line}, col={self.column})"
 
+# Forma compacta de um token produzida por Lexer.scan():
+# (tipo, valor, linha, coluna)
+RawToken = Tuple[TokenType, str, int, int]
+
+# Palavras-chave
+_KEYWORDS = {
+    "func": TokenType.FUNC,
+    "let": TokenType.LET,
+    "import": TokenType.IMPORT,
+    "spawn": TokenType.SPAWN,
+    "loop": TokenType.LOOP,
+    "match": TokenType.MATCH,
+    "case": TokenType.CASE,
+    "break": TokenType.BREAK,
+    "return": TokenType.RETURN,
+    "true": TokenType.BOOLEAN,
+    "false": TokenType.BOOLEAN,
+}
+
+# Tokens de grafia fixa compartilham a mesma string (internada) como valor,
+# em vez de uma fatia nova do código fonte por token
+_KEYWORD_TOKENS = {lexeme: (token_type, sys.intern(lexeme))
+                   for lexeme, token_type in _KEYWORDS.items()}
+
+# Operadores e delimitadores
+_OPERATORS = {
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.MULTIPLY,
+    "/": TokenType.DIVIDE,
+    "=": TokenType.ASSIGN,
+    "==": TokenType.EQUALS,
+    "!=": TokenType.NOT_EQUALS,
+    ">": TokenType.GREATER,
+    "<": TokenType.LESS,
+    ">=": TokenType.GREATER_EQUAL,
+    "<=": TokenType.LESS_EQUAL,
+    "=>": TokenType.ARROW,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "[": TokenType.LBRACKET,
+    "]": TokenType.RBRACKET,
+    ",": TokenType.COMMA,
+    ";": TokenType.SEMICOLON,
+    ":": TokenType.COLON,
+    ".": TokenType.DOT,
+}
+
+def _build_operator_dfa(operators):
+    """Monta o DFA (uma trie) dos operadores: transições por estado e o
+    (tipo, lexema) aceito em cada estado, ou None. O estado 0 é o inicial."""
+    transitions = [{}]
+    accept = [None]
+    for lexeme, token_type in operators.items():
+        state = 0
+        for char in lexeme:
+            if char not in transitions[state]:
+                transitions[state][char] = len(transitions)
+                transitions.append({})
+                accept.append(None)
+            state = transitions[state][char]
+        accept[state] = (token_type, sys.intern(lexeme))
+    return transitions, accept
+
+_OPERATOR_TRANSITIONS, _OPERATOR_ACCEPT = _build_operator_dfa(_OPERATORS)
+
+# Especialização derivada do DFA: operadores de um caractere cujo estado não
+# tem transições (não prefixam outro operador) são resolvidos com uma única
+# busca, sem percorrer o DFA
+_LEAF_OPERATORS = {char: _OPERATOR_ACCEPT[state]
+                   for char, state in _OPERATOR_TRANSITIONS[0].items()
+                   if not _OPERATOR_TRANSITIONS[state]}
+
+# Classes de caractere ASCII usadas no despacho do scanner, testadas por
+# pertinência em vez de str.isspace/isdecimal (que consultam tabelas Unicode).
+# Identificadores e números são apenas ASCII: [a-zA-Z_][a-zA-Z0-9_]* e \d+(\.\d+)?
+_WHITESPACE = frozenset(" \t\r\f\v")
+_DIGITS = frozenset(string.digits)
+_ID_START = frozenset(string.ascii_letters + "_")
+_ID_CONT = _ID_START | _DIGITS
+
+# Espaços em branco exceto '\n' (mesmo conjunto de str.isspace) e indentação
+_WS_RE = re.compile(r'[^\S\n]+')
+_INDENT_RE = re.compile(r' *')
+
 class Lexer:
     def __init__(self, source: str):
         self.source = source
         self.position = 0
-        self.line = 1
-        self.column = 1
         self.indent_stack = [0]
-        self.tokens = []
+        self._top_indent = 0  # cópia de indent_stack[-1]
+        self.tokens = []  # Token após tokenize(); RawToken após scan()
         
-        # Padrões para tokens
-        self.patterns = [
-            # Palavras-chave
-            (r'\bfunc\b', TokenType.FUNC),
-            (r'\blet\b', TokenType.LET),
-            (r'\bimport\b', TokenType.IMPORT),
-            (r'\bspawn\b', TokenType.SPAWN),
-            (r'\bloop\b', TokenType.LOOP),
-            (r'\bmatch\b', TokenType.MATCH),
-            (r'\bcase\b', TokenType.CASE),
-            (r'\bbreak\b', TokenType.BREAK),
-            (r'\breturn\b', TokenType.RETURN),
-            (r'\btrue\b', TokenType.BOOLEAN),
-            (r'\bfalse\b', TokenType.BOOLEAN),
-            
-            # Números
-            (r'\d+\.\d+', TokenType.NUMBER),  # Float
-            (r'\d+', TokenType.NUMBER),        # Integer
-            
-            # Strings
-            (r'"[^"]*"', TokenType.STRING),
-            (r"'[^']*'", TokenType.STRING),
-            
-            # Operadores
-            (r'\+', TokenType.PLUS),
-            (r'-', TokenType.MINUS),
-            (r'\*', TokenType.MULTIPLY),
-            (r'/', TokenType.DIVIDE),
-            (r'=', TokenType.ASSIGN),
-            (r'==', TokenType.EQUALS),
-            (r'!=', TokenType.NOT_EQUALS),
-            (r'>', TokenType.GREATER),
-            (r'<', TokenType.LESS),
-            (r'>=', TokenType.GREATER_EQUAL),
-            (r'<=', TokenType.LESS_EQUAL),
-            (r'=>', TokenType.ARROW),
-            
-            # Delimitadores
-            (r'\(', TokenType.LPAREN),
-            (r'\)', TokenType.RPAREN),
-            (r'\[', TokenType.LBRACKET),
-            (r'\]', TokenType.RBRACKET),
-            (r',', TokenType.COMMA),
-            (r';', TokenType.SEMICOLON),
-            (r':', TokenType.COLON),
-            (r'\.', TokenType.DOT),
-            
-            # Identificadores
-            (r'[a-zA-Z_][a-zA-Z0-9_]*', TokenType.IDENTIFIER),
-        ]
-        
-        # Compilar padrões regex
-        self.compiled_patterns = [(re.compile(pattern), token_type) 
-                                 for pattern, token_type in self.patterns]
+        # Posição de início de cada linha, para calcular linha/coluna sob demanda;
+        # a sentinela no fim dispensa testar o limite da lista em _locate
+        self._line_starts = [0] + [match.end() for match in re.finditer(r'\n', source)]
+        self._line_starts.append(len(source) + 1)
+        self._line_index = 0
     
     def tokenize(self) -> List[Token]:
         """Analisa o código fonte e retorna uma lista de tokens"""
-        while self.position < len(self.source):
+        self.tokens.extend(Token(type, value, line, column)
+                           for type, value, line, column in self.iter_tokens())
+        return self.tokens
+    
+    def scan(self) -> List[RawToken]:
+        """Analisa o código fonte e retorna os tokens como tuplas
+        (tipo, valor, linha, coluna), sem construir objetos Token; nesse caso
+        self.tokens também guarda as tuplas, não objetos Token"""
+        self.tokens.extend(self.iter_tokens())
+        return self.tokens
+    
+    def iter_tokens(self) -> Iterator[RawToken]:
+        """Gera os tokens como tuplas (tipo, valor, linha, coluna) à medida
+        que o código fonte é analisado, sem materializar a lista inteira"""
+        # O laço principal trabalha só com variáveis locais; self.position é
+        # sincronizado apenas ao chamar handle_newline
+        source = self.source
+        length = len(source)
+        locate = self._locate
+        position = self.position
+        
+        while position < length:
+            char = source[position]
+            
+            # Processar nova linha e indentação
+            if char == '\n':
+                self.position = position
+                yield from self.handle_newline()
+                position = self.position
+                continue
+            
             # Pular espaços em branco
-            if self.skip_whitespace():
+            if char in _WHITESPACE:
+                position = _WS_RE.match(source, position).end()
                 continue
             
-            # Pular comentários
-            if self.skip_comments():
+            # Identificadores e palavras-chave
+            if char in _ID_START:
+                end = position + 1
+                while end < length and source[end] in _ID_CONT:
+                    end += 1
+                value = source[position:end]
+                line, column = locate(position)
+                keyword = _KEYWORD_TOKENS.get(value)
+                # Palavras-chave exigem fronteira de palavra à esquerda: logo
+                # após um número ('1func') o lexema continua identificador
+                if keyword is None or (position and source[position - 1] in _DIGITS):
+                    # Nomes se repetem muito: internar faz ocorrências iguais
+                    # compartilharem a mesma string
+                    yield (TokenType.IDENTIFIER, sys.intern(value), line, column)
+                else:
+                    yield (keyword[0], keyword[1], line, column)
+                position = end
                 continue
             
-            # Processar nova linha e indentação
-            if self.source[self.position] == '\n':
-                self.handle_newline()
+            # Operadores e delimitadores que não prefixam outro operador
+            accepted = _LEAF_OPERATORS.get(char)
+            if accepted is not None:
+                line, column = locate(position)
+                yield (accepted[0], accepted[1], line, column)
+                position += 1
                 continue
             
-            # Tentar fazer match com padrões
-            token = self.match_patterns()
-            if token:
-                self.tokens.append(token)
+            # Pular comentários de linha única: vai direto até o próximo '\n'
+            if char == '#':
+                end = source.find('\n', position)
+                position = length if end == -1 else end
+                continue
+            
+            # Números: inteiros ou float com dígitos dos dois lados do '.'
+            if char in _DIGITS:
+                end = position + 1
+                while end < length and source[end] in _DIGITS:
+                    end += 1
+                if (end + 1 < length and source[end] == '.' and
+                        source[end + 1] in _DIGITS):
+                    end += 2
+                    while end < length and source[end] in _DIGITS:
+                        end += 1
+                line, column = locate(position)
+                yield (TokenType.NUMBER, source[position:end], line, column)
+                position = end
+                continue
+            
+            # Strings entre aspas duplas ou simples
+            if char == '"' or char == "'":
+                end = source.find(char, position + 1) + 1
+                if end:
+                    line, column = locate(position)
+                    yield (TokenType.STRING, source[position:end], line, column)
+                    position = end
+                    continue
+            
+            # Demais operadores: percorre o DFA guardando o último estado de
+            # aceitação, o que garante o match mais longo
+            state = _OPERATOR_TRANSITIONS[0].get(char)
+            if state is not None:
+                accepted = _OPERATOR_ACCEPT[state]
+                end = match_end = position + 1
+                while end < length:
+                    state = _OPERATOR_TRANSITIONS[state].get(source[end])
+                    if state is None:
+                        break
+                    end += 1
+                    if _OPERATOR_ACCEPT[state] is not None:
+                        accepted = _OPERATOR_ACCEPT[state]
+                        match_end = end
+                if accepted is not None:
+                    line, column = locate(position)
+                    yield (accepted[0], accepted[1], line, column)
+                    position = match_end
+                    continue
+            
+            # Espaços em branco fora do ASCII (caminho lento)
+            if char.isspace():
+                position = _WS_RE.match(source, position).end()
                 continue
             
             # Caractere não reconhecido
-            raise SyntaxError(f"Caractere não reconhecido '{self.source[self.position]}' "
-                           f"na linha {self.line}, coluna {self.column}")
+            line, column = locate(position)
+            raise SyntaxError(f"Caractere não reconhecido '{char}' "
+                           f"na linha {line}, coluna {column}")
+        
+        self.position = position
         
         # Adicionar tokens de indentação finais
-        self.handle_final_indentation()
+        yield from self.handle_final_indentation()
         
         # Adicionar EOF
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
-        
-        return self.tokens
-    
-    def skip_whitespace(self) -> bool:
-        """Pula espaços em branco e retorna True se pulou algum"""
-        skipped = False
-        while (self.position < len(self.source) and 
-               self.source[self.position].isspace() and 
-               self.source[self.position] != '\n'):
-            self.position += 1
-            self.column += 1
-            skipped = True
-        return skipped
+        line, column = locate(position)
+        yield (TokenType.EOF, "", line, column)
     
-    def skip_comments(self) -> bool:
-        """Pula comentários e retorna True se pulou algum"""
-        if (self.position < len(self.source) and 
-            self.source[self.position] == '#'):
-            # Comentário de linha única
-            while (self.position < len(self.source) and 
-                   self.source[self.position] != '\n'):
-                self.position += 1
-                self.column += 1
-            return True
-        return False
+    def _locate(self, position: int) -> Tuple[int, int]:
+        """Converte uma posição no código fonte em (linha, coluna)"""
+        # O scanner só avança, então basta mover o índice da linha atual;
+        # bisect fica para posições anteriores a ela
+        line_starts = self._line_starts
+        index = self._line_index
+        if position < line_starts[index]:
+            index = bisect_right(line_starts, position) - 1
+        else:
+            while line_starts[index + 1] <= position:
+                index += 1
+        self._line_index = index
+        return index + 1, position - line_starts[index] + 1
     
-    def handle_newline(self):
-        """Processa uma nova linha e gerencia indentação"""
-        self.tokens.append(Token(TokenType.NEWLINE, "\n", self.line, self.column))
+    def handle_newline(self) -> List[RawToken]:
+        """Processa uma nova linha e gerencia indentação; retorna o NEWLINE
+        seguido dos tokens de indentação gerados"""
+        line, column = self._locate(self.position)
+        tokens = [(TokenType.NEWLINE, "\n", line, column)]
         self.position += 1
-        self.line += 1
-        self.column = 1
         
         # Calcular indentação da próxima linha
-        indent_level = 0
-        while (self.position < len(self.source) and 
-               self.source[self.position] == ' '):
-            indent_level += 1
-            self.position += 1
-            self.column += 1
+        end = _INDENT_RE.match(self.source, self.position).end()
+        indent_level = end - self.position
+        self.position = end
+        
+        # Mesmo nível da linha anterior (o caso comum): nada a fazer
+        if indent_level == self._top_indent:
+            return tokens
         
         # Gerar tokens de indentação
-        current_indent = self.indent_stack[-1]
-        if indent_level > current_indent:
+        line, column = self._locate(self.position)
+        if indent_level > self._top_indent:
             self.indent_stack.append(indent_level)
-            self.tokens.append(Token(TokenType.INDENT, "", self.line, self.column))
-        elif indent_level < current_indent:
+            tokens.append((TokenType.INDENT, "", line, column))
+        else:
             while self.indent_stack and self.indent_stack[-1] > indent_level:
                 self.indent_stack.pop()
-                self.tokens.append(Token(TokenType.DEDENT, "", self.line, self.column))
-    
-    def match_patterns(self) -> Optional[Token]:
-        """Tenta fazer match com os padrões de tokens"""
-        for pattern, token_type in self.compiled_patterns:
-            match = pattern.match(self.source, self.position)
-            if match:
-                value = match.group(0)
-                token = Token(token_type, value, self.line, self.column)
-                self.position += len(value)
-                self.column += len(value)
-                return token
-        return None
+                tokens.append((TokenType.DEDENT, "", line, column))
+        self._top_indent = self.indent_stack[-1]
+        return tokens
     
-    def handle_final_indentation(self):
-        """Adiciona tokens de dedentação finais"""
-        while len(self.indent_stack) > 1:
-            self.indent_stack.pop()
-            self.tokens.append(Token(TokenType.DEDENT, "", self.line, self.column))
+    def handle_final_indentation(self) -> List[RawToken]:
+        """Retorna os tokens de dedentação finais"""
+        # Todos os DEDENTs finais são idênticos; como tokens são tuplas
+        # imutáveis, a mesma tupla pode se repetir na lista
+        line, column = self._locate(self.position)
+        tokens = [(TokenType.DEDENT, "", line, column)] * (len(self.indent_stack) - 1)
+        del self.indent_stack[1:]
+        self._top_indent = 0
+        return tokens
 
 def lex(source: str) -> List[Token]:
     """Função conveniente para tokenizar código fonte"""
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Testes de regressão da leitura de arquivos em app.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))))
+
+from app import read_file
+
+
+class ReadFileTests(unittest.TestCase):
+    def read(self, content: bytes):
+        with tempfile.NamedTemporaryFile(suffix=".aqua", delete=False) as fp:
+            fp.write(content)
+        self.addCleanup(os.remove, fp.name)
+        return read_file(fp.name)
+
+    def test_empty_file(self):
+        self.assertEqual(self.read(b""), [])
+
+    def test_crlf_and_lone_cr_end_lines(self):
+        self.assertEqual(self.read(b"a\rb\r\nc\n"), ["a", "b", "c"])
+
+    def test_blank_and_whitespace_only_lines_are_dropped(self):
+        self.assertEqual(self.read(b"a\n\n   \n\t\n  b\n"), ["a", "  b"])
+
+    def test_other_separators_stay_inside_the_line(self):
+        self.assertEqual(self.read("a\x0cb\x0bc d\n".encode("utf-8")),
+                         ["a\x0cb\x0bc d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Testes de regressão do lexer Python da linguagem Aqua
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import Lexer, TokenType, lex
+
+
+def types(source):
+    return [token.type for token in lex(source)]
+
+
+class LexerTests(unittest.TestCase):
+    def test_two_char_operators_win_over_prefixes(self):
+        self.assertEqual(types("a == b => c <= d >= e != f"), [
+            TokenType.IDENTIFIER, TokenType.EQUALS, TokenType.IDENTIFIER,
+            TokenType.ARROW, TokenType.IDENTIFIER, TokenType.LESS_EQUAL,
+            TokenType.IDENTIFIER, TokenType.GREATER_EQUAL, TokenType.IDENTIFIER,
+            TokenType.NOT_EQUALS, TokenType.IDENTIFIER, TokenType.EOF,
+        ])
+        self.assertEqual(types("= > <"), [
+            TokenType.ASSIGN, TokenType.GREATER, TokenType.LESS, TokenType.EOF,
+        ])
+
+    def test_lone_bang_is_an_error(self):
+        with self.assertRaises(SyntaxError):
+            lex("a ! b")
+
+    def test_keyword_needs_word_boundary_after_number(self):
+        self.assertEqual(types("1func true"), [
+            TokenType.NUMBER, TokenType.IDENTIFIER, TokenType.BOOLEAN, TokenType.EOF,
+        ])
+
+    def test_indent_and_dedent(self):
+        source = "func f()\n    if x\n        y\n    z\nw\n"
+        self.assertEqual(types(source), [
+            TokenType.FUNC, TokenType.IDENTIFIER, TokenType.LPAREN, TokenType.RPAREN,
+            TokenType.NEWLINE, TokenType.INDENT, TokenType.IDENTIFIER, TokenType.IDENTIFIER,
+            TokenType.NEWLINE, TokenType.INDENT, TokenType.IDENTIFIER,
+            TokenType.NEWLINE, TokenType.DEDENT, TokenType.IDENTIFIER,
+            TokenType.NEWLINE, TokenType.DEDENT, TokenType.IDENTIFIER,
+            TokenType.NEWLINE, TokenType.EOF,
+        ])
+
+    def test_dedent_to_level_not_on_stack(self):
+        # Pilha [0, 4]; a linha com 2 espaços desempilha até 0 sem gerar
+        # INDENT, e uma nova linha com 4 espaços volta a indentar
+        self.assertEqual(types("a\n    b\n  c\n    d\n"), [
+            TokenType.IDENTIFIER, TokenType.NEWLINE, TokenType.INDENT, TokenType.IDENTIFIER,
+            TokenType.NEWLINE, TokenType.DEDENT, TokenType.IDENTIFIER,
+            TokenType.NEWLINE, TokenType.INDENT, TokenType.IDENTIFIER,
+            TokenType.NEWLINE, TokenType.DEDENT, TokenType.EOF,
+        ])
+
+    def test_comments_are_skipped(self):
+        self.assertEqual(types("x # comentário == !\ny"), [
+            TokenType.IDENTIFIER, TokenType.NEWLINE, TokenType.IDENTIFIER, TokenType.EOF,
+        ])
+
+    def test_unterminated_string_is_an_error(self):
+        with self.assertRaises(SyntaxError):
+            lex('let s = "sem fim')
+
+    def test_position_after_multiline_string(self):
+        tokens = lex('s = "a\nb" x')
+        self.assertEqual((tokens[2].type, tokens[2].line, tokens[2].column),
+                         (TokenType.STRING, 1, 5))
+        self.assertEqual((tokens[3].value, tokens[3].line, tokens[3].column), ("x", 2, 4))
+
+    def test_tokenize_and_scan_fill_tokens(self):
+        lexer = Lexer("a = 1\n")
+        self.assertIs(lexer.tokenize(), lexer.tokens)
+        self.assertEqual(lexer.tokens[0].value, "a")
+
+        lexer = Lexer("a = 1\n")
+        self.assertIs(lexer.scan(), lexer.tokens)
+        self.assertEqual(lexer.tokens[0], (TokenType.IDENTIFIER, "a", 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()